@@ -1,9 +1,11 @@
 """
 Agent Orchestrator - Core agent logic coordinating Claude and MCP tools
 """
+import asyncio
+import json
 import time
 import uuid
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import structlog
 
 from claude_client import ClaudeClient
@@ -77,46 +79,44 @@ class AgentOrchestrator:
                     "content": response.content
                 })
                 
-                # Execute all tool calls
+                # Execute all tool calls from this turn concurrently
+                tool_blocks = [
+                    content_block for content_block in response.content
+                    if content_block.type == "tool_use"
+                ]
+                outcomes = await asyncio.gather(
+                    *(self._execute_tool_call(content_block) for content_block in tool_blocks)
+                )
+                
                 tool_result_content = []
-                for content_block in response.content:
-                    if content_block.type == "tool_use":
-                        logger.info(f"Executing tool: {content_block.name}")
-                        
-                        try:
-                            # Execute tool via MCP server
-                            result = await self.mcp_tool_router.execute_tool(
-                                tool_name=content_block.name,
-                                tool_input=content_block.input
-                            )
-                            
-                            tool_result_content.append({
-                                "type": "tool_result",
-                                "tool_use_id": content_block.id,
-                                "content": str(result)
-                            })
-                            
-                            tool_results.append({
-                                "tool": content_block.name,
-                                "input": content_block.input,
-                                "result": result
-                            })
-                            
-                            # Track sources if it's an API search/call
-                            if content_block.name in ["search_apis", "call_api"]:
-                                sources_used.append({
-                                    "tool": content_block.name,
-                                    "input": content_block.input
-                                })
-                            
-                        except Exception as e:
-                            logger.error(f"Tool execution failed: {content_block.name}", error=str(e))
-                            tool_result_content.append({
-                                "type": "tool_result",
-                                "tool_use_id": content_block.id,
-                                "content": f"Error: {str(e)}",
-                                "is_error": True
-                            })
+                for content_block, (result, error) in zip(tool_blocks, outcomes):
+                    if error is not None:
+                        tool_result_content.append({
+                            "type": "tool_result",
+                            "tool_use_id": content_block.id,
+                            "content": f"Error: {str(error)}",
+                            "is_error": True
+                        })
+                        continue
+                    
+                    tool_result_content.append({
+                        "type": "tool_result",
+                        "tool_use_id": content_block.id,
+                        "content": str(result)
+                    })
+                    
+                    tool_results.append({
+                        "tool": content_block.name,
+                        "input": content_block.input,
+                        "result": result
+                    })
+                    
+                    # Track sources if it's an API search/call
+                    if content_block.name in ["search_apis", "call_api"]:
+                        sources_used.append({
+                            "tool": content_block.name,
+                            "input": content_block.input
+                        })
                 
                 # Add tool results to conversation
                 conversation_messages.append({
@@ -170,7 +170,6 @@ class AgentOrchestrator:
                     )
                     
                     # Extract report path from result
-                    import json
                     if report_result and len(report_result) > 0:
                         report_data = json.loads(report_result[0].get("text", "{}"))
                         report_path = report_data.get("report_path")
@@ -194,6 +193,21 @@ class AgentOrchestrator:
             logger.error("Query processing failed", error=str(e), query_id=query_id)
             raise
     
+    async def _execute_tool_call(self, content_block: Any) -> Tuple[Any, Optional[Exception]]:
+        """Execute a single tool_use block, returning (result, error)"""
+        logger.info(f"Executing tool: {content_block.name}")
+        
+        try:
+            # Execute tool via MCP server
+            result = await self.mcp_tool_router.execute_tool(
+                tool_name=content_block.name,
+                tool_input=content_block.input
+            )
+            return result, None
+        except Exception as e:
+            logger.error(f"Tool execution failed: {content_block.name}", error=str(e))
+            return None, e
+    
     def _extract_text_from_response(self, response: Any) -> str:
         """Extract text content from Claude response"""
         text_parts = []
@@ -2,8 +2,8 @@
 Claude Client - Direct interface with Anthropic Claude API
 """
 import os
-from typing import List, Dict, Any, Optional
-from anthropic import Anthropic
+from typing import List, Dict, Any, Optional, Sequence
+from anthropic import AsyncAnthropic
 import structlog
 import asyncio
 
@@ -18,14 +18,14 @@ class ClaudeClient:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY is required")
         
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = AsyncAnthropic(api_key=self.api_key)
         self.model = "claude-3-haiku-20240307"  # Claude 3 Haiku (available on your account)
         self.max_retries = 3
     
     async def call_with_tools(
         self,
         messages: List[Dict[str, Any]],
-        tools: List[Dict[str, Any]],
+        tools: Sequence[Dict[str, Any]],
         max_tokens: int = 4096
     ) -> Any:
         """Call Claude with tool definitions and handle retries"""
@@ -39,8 +39,8 @@ class ClaudeClient:
                     attempt=attempt + 1
                 )
                 
-                # Call Claude API (synchronous)
-                response = self.client.messages.create(
+                # Call Claude API without blocking the event loop
+                response = await self.client.messages.create(
                     model=self.model,
                     max_tokens=max_tokens,
                     tools=tools,
@@ -0,0 +1,19 @@
+"""
+Shared pytest configuration
+"""
+import asyncio
+import sys
+
+# Standalone probe script that calls the Claude API at import time
+collect_ignore = ["test_api_key.py"]
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop where available (installed with uvicorn[standard])"""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            return {"uvloop": uvloop.new_event_loop}
+        except ImportError:
+            pass
+    return {"asyncio": asyncio.new_event_loop}
@@ -1,8 +1,10 @@
 """
 FastAPI Server - Main application entry point
 """
+import asyncio
 import os
 import sys
+import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI, HTTPException, Request
@@ -78,6 +80,7 @@ async def lifespan(app: FastAPI):
         # Memory Store
         try:
             memory_store = MemoryStore(redis_url)
+            await memory_store.connect()
             logger.info("Memory store initialized")
         except Exception as e:
             logger.warning("Redis unavailable, running in degraded mode", error=str(e))
@@ -99,6 +102,8 @@ async def lifespan(app: FastAPI):
         logger.info("Shutting down...")
         if mcp_tool_router:
             await mcp_tool_router.close_all()
+        if memory_store:
+            await memory_store.close()
         logger.info("Shutdown complete")
         
     except Exception as e:
@@ -128,7 +133,6 @@ app.add_middleware(
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     """Add request ID to all requests"""
-    import uuid
     request_id = str(uuid.uuid4())
     
     # Add to structlog context
@@ -157,7 +161,10 @@ async def research_query(request: ResearchRequest):
             include_report=request.include_report
         )
         
-        return ResearchResponse(**result)
+        # Validated here, inside the try, so a bad result is logged; the
+        # JSONResponse then skips FastAPI's second response_model pass
+        response = ResearchResponse(**result)
+        return JSONResponse(content=response.model_dump(mode="json"))
         
     except Exception as e:
         logger.error("Query processing failed", error=str(e))
@@ -171,16 +178,20 @@ async def get_history(limit: int = 50, offset: int = 0):
     """
     try:
         if not memory_store:
-            return HistoryResponse(queries=[], total=0, limit=limit, offset=offset)
+            response = HistoryResponse(queries=[], total=0, limit=limit, offset=offset)
+            return JSONResponse(content=response.model_dump(mode="json"))
         
         queries = await memory_store.get_history(limit=limit, offset=offset)
         
-        return HistoryResponse(
+        # Validated here so bad entries are logged; the JSONResponse skips
+        # FastAPI's second response_model pass
+        response = HistoryResponse(
             queries=queries,
             total=len(queries),
             limit=limit,
             offset=offset
         )
+        return JSONResponse(content=response.model_dump(mode="json"))
         
     except Exception as e:
         logger.error("Failed to get history", error=str(e))
@@ -196,12 +207,14 @@ async def list_reports(limit: int = 20):
         if not report_generator:
             raise HTTPException(status_code=503, detail="Report generator not initialized")
         
-        reports = report_generator.list_reports(limit=limit)
+        # Directory scan and stats run off the event loop
+        reports = await asyncio.to_thread(report_generator.list_reports, limit=limit)
         
-        return ReportsListResponse(
+        response = ReportsListResponse(
             reports=reports,
             total=len(reports)
         )
+        return JSONResponse(content=response.model_dump(mode="json"))
         
     except Exception as e:
         logger.error("Failed to list reports", error=str(e))
@@ -217,7 +230,7 @@ async def get_report(report_id: str):
         if not report_generator:
             raise HTTPException(status_code=503, detail="Report generator not initialized")
         
-        content = report_generator.get_report(report_id)
+        content = await asyncio.to_thread(report_generator.get_report, report_id)
         
         return JSONResponse(content={"report_id": report_id, "content": content})
         
@@ -236,7 +249,7 @@ async def health_check():
     redis_connected = False
     if memory_store:
         try:
-            memory_store.client.ping()
+            await memory_store.client.ping()
             redis_connected = True
         except:
             pass
@@ -6,7 +6,7 @@ import asyncio
 import os
 import json
 import subprocess
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional, Tuple
 import structlog
 
 logger = structlog.get_logger()
@@ -19,6 +19,7 @@ class MCPToolRouter:
         self.processes: Dict[str, subprocess.Popen] = {}
         self.tool_registry: Dict[str, str] = {}
         self.tool_schemas: Dict[str, Dict[str, Any]] = {}
+        self._tool_definitions: Optional[Tuple[Dict[str, Any], ...]] = None
         
         # Get absolute paths for MCP servers
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -125,6 +126,7 @@ class MCPToolRouter:
     async def connect_all(self):
         """Register all MCP tools from configuration"""
         logger.info("Registering MCP tools...")
+        self._tool_definitions = None
         
         for server_name, config in self.mcp_config.items():
             try:
@@ -144,8 +146,11 @@ class MCPToolRouter:
         if len(self.tool_registry) == 0:
             logger.warning("No MCP tools available - running in degraded mode")
     
-    def get_tool_definitions(self) -> List[Dict[str, Any]]:
-        """Get all tool definitions for Claude"""
+    def get_tool_definitions(self) -> Tuple[Dict[str, Any], ...]:
+        """Get all tool definitions for Claude (cached and shared: do not mutate)"""
+        if self._tool_definitions is not None:
+            return self._tool_definitions
+        
         all_tools = []
         
         for tool_name, tool_schema in self.tool_schemas.items():
@@ -155,7 +160,8 @@ class MCPToolRouter:
                 "input_schema": tool_schema["input_schema"]
             })
         
-        return all_tools
+        self._tool_definitions = tuple(all_tools)
+        return self._tool_definitions
     
     async def execute_tool(
         self,
@@ -260,3 +266,4 @@ class MCPToolRouter:
         logger.info("Cleaning up MCP tool router...")
         self.tool_registry.clear()
         self.tool_schemas.clear()
+        self._tool_definitions = None
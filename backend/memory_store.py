@@ -1,7 +1,7 @@
 """
 Memory Store - Simple Redis storage for query history
 """
-import redis
+import redis.asyncio as redis
 import json
 import time
 import uuid
@@ -14,17 +14,30 @@ logger = structlog.get_logger()
 class MemoryStore:
     """Simple Redis storage for query history"""
     
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, max_connections: int = 100):
         self.redis_url = redis_url
+        # Non-blocking client backed by one bounded pool shared by all requests
+        self.pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            decode_responses=True
+        )
+        self.client = redis.Redis(connection_pool=self.pool)
+    
+    async def connect(self):
+        """Test the Redis connection"""
         try:
-            self.client = redis.from_url(redis_url, decode_responses=True)
-            # Test connection
-            self.client.ping()
-            logger.info("Connected to Redis", url=redis_url)
+            await self.client.ping()
+            logger.info("Connected to Redis", url=self.redis_url)
         except Exception as e:
             logger.error("Failed to connect to Redis", error=str(e))
             raise
     
+    async def close(self):
+        """Close the client and its connection pool"""
+        await self.client.aclose()
+        await self.pool.disconnect()
+    
     async def store(
         self,
         query: str,
@@ -34,22 +47,27 @@ class MemoryStore:
         """Store query and results in Redis"""
         try:
             query_id = f"query:{uuid.uuid4()}"
+            timestamp = time.time()
             
-            self.client.hset(
-                query_id,
-                mapping={
-                    "query_text": query,
-                    "results_summary": json.dumps(results),
-                    "timestamp": time.time(),
-                    "api_sources": json.dumps(sources)
-                }
-            )
-            
-            # Set expiration (30 days)
-            self.client.expire(query_id, 30 * 24 * 60 * 60)
-            
-            # Add to sorted set for chronological retrieval
-            self.client.zadd("queries:timeline", {query_id: time.time()})
+            # Send all writes in a single round trip
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    query_id,
+                    mapping={
+                        "query_text": query,
+                        "results_summary": json.dumps(results),
+                        "timestamp": timestamp,
+                        "api_sources": json.dumps(sources)
+                    }
+                )
+                
+                # Set expiration (30 days)
+                pipe.expire(query_id, 30 * 24 * 60 * 60)
+                
+                # Add to sorted set for chronological retrieval
+                pipe.zadd("queries:timeline", {query_id: timestamp})
+                
+                await pipe.execute()
             
             logger.info("Query stored in Redis", query_id=query_id)
             return query_id
@@ -66,15 +84,20 @@ class MemoryStore:
         """Get past queries in chronological order"""
         try:
             # Get query IDs from sorted set (most recent first)
-            query_ids = self.client.zrevrange(
+            query_ids = await self.client.zrevrange(
                 "queries:timeline",
                 offset,
                 offset + limit - 1
             )
             
+            # Fetch all query hashes in a single round trip
+            async with self.client.pipeline(transaction=False) as pipe:
+                for query_id in query_ids:
+                    pipe.hgetall(query_id)
+                entries = await pipe.execute()
+            
             queries = []
-            for query_id in query_ids:
-                data = self.client.hgetall(query_id)
+            for query_id, data in zip(query_ids, entries):
                 if data:
                     queries.append({
                         "query_id": query_id,
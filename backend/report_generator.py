@@ -23,12 +23,13 @@ class ReportGenerator:
         try:
             reports = []
             for report_file in sorted(self.output_dir.glob("*.md"), reverse=True)[:limit]:
+                stat = report_file.stat()
                 reports.append({
                     "report_id": report_file.stem,
                     "filename": report_file.name,
                     "path": str(report_file),
-                    "size": report_file.stat().st_size,
-                    "created": report_file.stat().st_mtime
+                    "size": stat.st_size,
+                    "created": stat.st_mtime
                 })
             
             logger.info(f"Listed {len(reports)} reports")